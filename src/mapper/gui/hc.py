@@ -9,9 +9,10 @@ from __future__ import annotations
 # Built-in Modules:
 import logging
 import math
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from contextlib import suppress
 from enum import Enum, auto
+from functools import lru_cache
 from queue import Empty as QueueEmpty
 from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Protocol, Union
 
@@ -26,7 +27,7 @@ from speechlight import Speech
 from .vec2d import Vec2d
 from .. import cfg
 from ..roomdata.objects import DIRECTION_COORDINATES, DIRECTIONS, Exit, Room
-from ..typedef import GUI_QUEUE_TYPE
+from ..typedef import GUI_QUEUE_EVENT_TYPE, GUI_QUEUE_TYPE
 
 
 if TYPE_CHECKING:
@@ -41,6 +42,9 @@ AGGRESSIVE_MOB_FLAGS: set[str] = {"aggressive_mob", "elite_mob", "super_mob"}
 DIRECTIONS_2D: set[str] = set(DIRECTIONS[:-2])
 DIRECTIONS_UD: set[str] = set(DIRECTIONS[-2:])
 DIRECTION_COORDINATES_2D: dict[str, Vec2d] = {d: Vec2d(*DIRECTION_COORDINATES[d][:2]) for d in DIRECTIONS_2D}
+# Used for rotating the corners of an equilateral triangle by 120 degrees.
+COS_120: float = math.cos(math.radians(120))
+SIN_120: float = math.sin(math.radians(120))
 KEYS: dict[tuple[int, int], str] = {
 	(key.ESCAPE, 0): "resetZoom",
 	(key.LEFT, 0): "adjustSize",
@@ -83,11 +87,38 @@ pyglet.options["debug_gl"] = False
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _unitTriangleCorners(angle: float) -> tuple[float, float, float, float, float, float]:
+	"""
+	Calculates the corners of an equilateral triangle with a radius of 1, centered on the origin.
+
+	Exits are only drawn at a few fixed angles, so caching means the trig is computed once per angle.
+
+	Args:
+		angle: The angle of the triangle in degrees.
+
+	Returns:
+		The X and Y coordinates of the 3 corners.
+	"""
+	radians = math.radians(angle)
+	x1 = math.cos(radians)
+	y1 = math.sin(radians)
+	x2 = x1 * COS_120 - y1 * SIN_120
+	y2 = x1 * SIN_120 + y1 * COS_120
+	x3 = x2 * COS_120 - y2 * SIN_120
+	y3 = x2 * SIN_120 + y2 * COS_120
+	return x1, y1, x2, y2, x3, y3
+
+
 class BatchType(Protocol):
 	def draw(self) -> None: ...
 
 
 class ShapeType(Protocol):
+	color: Sequence[int]
+	group: GroupType
+	visible: bool
+
 	@property
 	def position(self) -> tuple[float, float]: ...
 
@@ -97,6 +128,11 @@ class ShapeType(Protocol):
 	def delete(self) -> None: ...
 
 
+class RectangleType(ShapeType, Protocol):
+	width: float
+	height: float
+
+
 class GroupType(Protocol):
 	def __init__(self, order: int = 0, parent: Optional[GroupType] = None) -> None: ...
 
@@ -151,17 +187,34 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		terrainColors.update(DEFAULT_TERRAIN_COLORS)
 		terrainColors.update(self._cfg.get("terrain_colors", {}))
 		self.terrainColors: dict[str, Color] = {k: Color(*v) for k, v in terrainColors.items()}
+		self.undefinedTerrainColor: Color = self.terrainColors["undefined"]
 		miscColors: dict[str, tuple[int, ...]] = {}
 		miscColors.update(DEFAULT_MISC_COLORS)
 		miscColors.update(self._cfg.get("misc_colors", {}))
 		self.miscColors: dict[str, Color] = {k: Color(*v) for k, v in miscColors.items()}
 		self.batch: BatchType = pyglet.graphics.Batch()
-		self.visibleRooms: dict[str, tuple[ShapeType, Room, Vec2d]] = {}
+		self.visibleRooms: dict[str, tuple[RectangleType, Room, Vec2d]] = {}
+		# Hidden room squares, recycled instead of being deleted and recreated as the map scrolls.
+		self.roomShapePool: list[RectangleType] = []
 		self.visibleRoomFlags: dict[str, tuple[ShapeType, ...]] = {}
-		self.visibleExits: dict[str, tuple[ShapeType, ...]] = {}
+		self.visibleExits: dict[tuple[str, str], tuple[ShapeType, ...]] = {}
 		self.centerMark: list[ShapeType] = []
 		self.highlight: Union[str, None] = None
 		self.currentRoom: Union[Room, None] = None
+		# Key bindings, resolved to bound methods once rather than on every key press.
+		self.keyHandlers: dict[tuple[int, int], Callable[[int, int], None]] = {}
+		for keyBinding, name in KEYS.items():
+			funcName = "keyboard_" + name
+			func = getattr(self, funcName, None)
+			if func is None:
+				logger.error(f"Invalid key assignment for key {keyBinding}. No such function {funcName}.")
+			else:
+				self.keyHandlers[keyBinding] = func
+		# Cached geometry, cleared when the window or room size changes.
+		self._cp: Union[Vec2d, None] = None
+		self._roomDrawRadius: Union[tuple[int, int, int], None] = None
+		# The current room vnum, rooms generation, room size, and window size from the last redraw.
+		self._lastRedraw: Union[tuple[str, int, int, int, int], None] = None
 		super().__init__(caption="MPM", resizable=True, vsync=False)
 		self._originalLocation: tuple[int, int] = self.get_location()
 		self._originalSize: tuple[int, int] = self.get_size()
@@ -240,6 +293,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 	@roomSize.setter
 	def roomSize(self, value: int) -> None:
 		self._cfg["room_size"] = int(clamp(value, 20, 300))
+		self._roomDrawRadius = None
 
 	@property
 	def roomScale(self) -> float:
@@ -261,17 +315,21 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 	@property
 	def cp(self) -> Vec2d:
 		"""A vector of the center point in pixels."""
-		return Vec2d(self.width / 2.0, self.height / 2.0)
+		if self._cp is None:
+			self._cp = Vec2d(self.width * 0.5, self.height * 0.5)
+		return self._cp
 
 	@property
 	def roomDrawRadius(self) -> tuple[int, int, int]:
 		"""The radius in room coordinates, used when searching for neighboring rooms."""
-		roomSize: int = self.roomSize
-		return (
-			int(math.ceil(self.width / roomSize / 2)),
-			int(math.ceil(self.height / roomSize / 2)),
-			1,
-		)
+		if self._roomDrawRadius is None:
+			roomSize: int = self.roomSize
+			self._roomDrawRadius = (
+				int(math.ceil(self.width / roomSize / 2)),
+				int(math.ceil(self.height / roomSize / 2)),
+				1,
+			)
+		return self._roomDrawRadius
 
 	def roomBottomLeft(self, cp: Vec2d) -> Vec2d:
 		"""
@@ -356,11 +414,13 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		Returns:
 			The 3 corners of an equilateral triangle.
 		"""
-		vec = Vec2d(radius, 0)
-		point1 = vec.rotated_degrees(angle)
-		point2 = point1.rotated_degrees(120)
-		point3 = point2.rotated_degrees(120)
-		return point1 + cp, point2 + cp, point3 + cp
+		x1, y1, x2, y2, x3, y3 = _unitTriangleCorners(angle)
+		cx, cy = cp
+		return (
+			Vec2d(x1 * radius + cx, y1 * radius + cy),
+			Vec2d(x2 * radius + cx, y2 * radius + cy),
+			Vec2d(x3 * radius + cx, y3 * radius + cy),
+		)
 
 	def drawBorderedTriangle(
 		self,
@@ -624,18 +684,27 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 
 	def deleteStaleRooms(self, excludes: Optional[Iterable[str]] = None) -> None:
 		"""
-		Deletes stale room shapes which are no longer visible.
+		Hides stale room shapes which are no longer visible.
+
+		The hidden shapes are added to the room shape pool, to be reused by `drawRoom`.
+		The pool is limited to the number of rooms which fit in the window, and any excess shapes are deleted.
 
 		Args:
 			excludes: Room vnums to exclude from deletion.
 		"""
-		stale: set[str] = (
-			set(self.visibleRooms) if excludes is None else set(self.visibleRooms).difference(excludes)
-		)
+		stale: set[str] = set(self.visibleRooms) if excludes is None else self.visibleRooms.keys() - excludes
+		radiusX, radiusY, _ = self.roomDrawRadius
+		poolSize: int = (radiusX * 2 + 1) * (radiusY * 2 + 1)
 		with suppress(AssertionError):
 			for vnum in stale:
-				self.visibleRooms[vnum][0].delete()
-				del self.visibleRooms[vnum]
+				square = self.visibleRooms.pop(vnum)[0]
+				if len(self.roomShapePool) < poolSize:
+					square.visible = False
+					self.roomShapePool.append(square)
+				else:
+					square.delete()
+			while len(self.roomShapePool) > poolSize:
+				self.roomShapePool.pop().delete()
 
 	def deleteStaleRoomFlags(self, excludes: Optional[Iterable[str]] = None) -> None:
 		"""
@@ -644,26 +713,24 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		Args:
 			excludes: Room flag vnums to exclude from deletion.
 		"""
-		stale: set[str]
-		if excludes is None:
-			stale = set(self.visibleRoomFlags)
-		else:
-			stale = set(self.visibleRoomFlags).difference(excludes)
+		stale: set[str] = (
+			set(self.visibleRoomFlags) if excludes is None else self.visibleRoomFlags.keys() - excludes
+		)
 		with suppress(AssertionError):
 			for vnum in stale:
 				for shape in self.visibleRoomFlags[vnum]:
 					shape.delete()
 				del self.visibleRoomFlags[vnum]
 
-	def deleteStaleExits(self, excludes: Optional[Iterable[str]] = None) -> None:
+	def deleteStaleExits(self, excludes: Optional[Iterable[tuple[str, str]]] = None) -> None:
 		"""
 		Deletes stale exit shapes which are no longer visible.
 
 		Args:
 			excludes: Exit names to exclude from deletion.
 		"""
-		stale: set[str] = (
-			set(self.visibleExits) if excludes is None else set(self.visibleExits).difference(excludes)
+		stale: set[tuple[str, str]] = (
+			set(self.visibleExits) if excludes is None else self.visibleExits.keys() - excludes
 		)
 		with suppress(AssertionError):
 			for name in stale:
@@ -686,14 +753,14 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			)
 		)
 
-	def drawUpDownExit(self, direction: str, exitObj: Exit, name: str, cp: Vec2d) -> None:
+	def drawUpDownExit(self, direction: str, exitObj: Exit, name: tuple[str, str], cp: Vec2d) -> None:
 		"""
 		Draws an up or down exit.
 
 		Args:
 			direction: The direction of the exit.
 			exitObj: The exit object.
-			name: A unique name for referencing the associated shapes.
+			name: A unique (vnum, direction) name for referencing the associated shapes.
 			cp: The center point of the room containing the exit.
 		"""
 		triangleSize = self.walledRoomSize / 3
@@ -734,13 +801,13 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			borderTriangle.position = border1
 			innerTriangle.position = inner1
 
-	def drawDeathExit2d(self, direction: str, name: str, cp: Vec2d) -> None:
+	def drawDeathExit2d(self, direction: str, name: tuple[str, str], cp: Vec2d) -> None:
 		"""
 		Draws a deathtrap for a 2D exit.
 
 		Args:
 			direction: The direction of the deathtrap exit.
-			name: A unique name for referencing the associated shape.
+			name: A unique (vnum, direction) name for referencing the associated shape.
 			cp: The center point of the room containing the exit.
 		"""
 		width = height = roomSize = self.roomSize
@@ -769,11 +836,11 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		2D walls and 2D undefined/one-way exits are represented by trimming the dimensions of the room.
 		"""
 		logger.debug("Drawing special exits")
-		visibleExits = set()
+		visibleExits: set[tuple[str, str]] = set()
 		for vnum, item in self.visibleRooms.items():
 			square, room, cp = item
 			for direction, exitObj in room.exits.items():
-				name = vnum + direction
+				name = (vnum, direction)
 				if direction in DIRECTIONS_UD:
 					self.drawUpDownExit(direction, exitObj, name, cp)
 					visibleExits.add(name)
@@ -806,6 +873,31 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			for shape in self.visibleRoomFlags[room.vnum]:
 				shape.position = cp
 
+	def updateRoomSquare(
+		self, square: RectangleType, left: float, bottom: float, width: float, height: float, group: GroupType
+	) -> None:
+		"""
+		Updates the geometry and group of a room square.
+
+		Each assignment rewrites the shape's vertex data, so only the values which changed are assigned.
+
+		Args:
+			square: The room square.
+			left: The X coordinate of the bottom left corner in pixels.
+			bottom: The Y coordinate of the bottom left corner in pixels.
+			width: The width in pixels.
+			height: The height in pixels.
+			group: The group (I.E. layer) where the square will appear.
+		"""
+		if square.position != (left, bottom):
+			square.position = (left, bottom)
+		if square.width != width:
+			square.width = width
+		if square.height != height:
+			square.height = height
+		if square.group != group:
+			square.group = group
+
 	def drawRoom(self, room: Room, cp: Vec2d, group: Optional[GroupType] = None) -> None:
 		"""
 		Draws a room.
@@ -823,10 +915,8 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			color = self.miscColors["highlight"]
 		elif room.avoid:
 			color = self.terrainColors["deathtrap"]
-		elif room.terrain not in self.terrainColors:
-			color = self.terrainColors["undefined"]
 		else:
-			color = self.terrainColors[room.terrain]
+			color = self.terrainColors.get(room.terrain, self.undefinedTerrainColor)
 		walls2d = DIRECTIONS_2D.difference(room.exits)
 		for direction, exitObj in room.exits.items():
 			if direction in DIRECTIONS_2D and (
@@ -836,22 +926,30 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 				walls2d.add(direction)
 		width = height = self.roomSize
 		wallSize = self.wallSize
-		bottomLeft = cp - (width / 2, height / 2)
+		# Plain floats avoid creating intermediate Vec2d objects for every room drawn.
+		left: float = cp.x - width / 2
+		bottom: float = cp.y - height / 2
 		if "north" in walls2d:
 			height -= wallSize  # Trim size from top.
 		if "east" in walls2d:
 			width -= wallSize  # Trim size from right.
 		if "south" in walls2d:
-			bottomLeft += (0, wallSize)  # Trim size from bottom.
+			bottom += wallSize  # Trim size from bottom.
 		if "west" in walls2d:
-			bottomLeft += (wallSize, 0)  # Trim size from left.
-		if room.vnum not in self.visibleRooms:
-			square = shapes.Rectangle(*bottomLeft, width, height, color=color, batch=self.batch, group=group)
+			left += wallSize  # Trim size from left.
+		if room.vnum not in self.visibleRooms and self.roomShapePool:
+			square = self.roomShapePool.pop()
+			self.updateRoomSquare(square, left, bottom, width, height, group)
+			# A recycled shape is only shown once its geometry is up to date.
+			square.color = color
+			square.visible = True
+			self.visibleRooms[room.vnum] = (square, room, cp)
+		elif room.vnum not in self.visibleRooms:
+			square = shapes.Rectangle(left, bottom, width, height, color=color, batch=self.batch, group=group)
 			self.visibleRooms[room.vnum] = (square, room, cp)
 		else:
 			square = self.visibleRooms[room.vnum][0]
-			square.position = bottomLeft
-			square.group = group
+			self.updateRoomSquare(square, left, bottom, width, height, group)
 			self.visibleRooms[room.vnum] = (square, room, cp)
 
 	def drawRooms(self) -> None:
@@ -860,16 +958,18 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		if currentRoom is None:
 			logger.error("Unable to draw rooms: Current room undefined.")
 			return
-		logger.debug(f"Drawing rooms near {currentRoom}")
+		logger.debug("Drawing rooms near %s", currentRoom)
 		roomSize = self.roomSize
+		centerPoint = self.cp
+		centerX, centerY = centerPoint
 		visibleRooms = {currentRoom.vnum}
-		self.drawRoom(currentRoom, self.cp, group=Groups.PRIORITY_ROOM.value)
-		self.drawRoomFlags(currentRoom, self.cp)
+		self.drawRoom(currentRoom, centerPoint, group=Groups.PRIORITY_ROOM.value)
+		self.drawRoomFlags(currentRoom, centerPoint)
 		neighbors = self.world.getNeighborsFromRoom(start=currentRoom, radius=self.roomDrawRadius)
 		for vnum, room, x, y, z in neighbors:
 			if z == 0:
 				visibleRooms.add(vnum)
-				cp = self.cp + Vec2d(x * roomSize, y * roomSize)  # In pixels.
+				cp = Vec2d(centerX + x * roomSize, centerY + y * roomSize)  # In pixels.
 				self.drawRoom(room, cp)
 				self.drawRoomFlags(room, cp)
 		self.deleteStaleRooms(visibleRooms)
@@ -887,7 +987,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		`pyglet.app.event_loop` is being used, `close` is also called,
 		closing the window immediately.
 		"""
-		logger.debug(f"Closing window {self}")
+		logger.debug("Closing window %s", self)
 		cfg["gui"].update(self._cfg)
 		cfg.save()
 		super().on_close()
@@ -921,20 +1021,16 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			symbol: The key symbol pressed.
 			modifiers: Bitwise combination of the key modifiers active.
 		"""
-		logger.debug(f"Key press: symbol: {symbol}, modifiers: {modifiers}")
+		logger.debug("Key press: symbol: %s, modifiers: %s", symbol, modifiers)
 		key = (symbol, modifiers)
-		if key in KEYS:
-			funcName = "keyboard_" + KEYS[key]
-			func = getattr(self, funcName, None)
-			if func is None:
-				logger.error(f"Invalid key assignment for key {key}. No such function {funcName}.")
-			else:
-				try:
-					func(symbol, modifiers)
-				except Exception:
-					logger.exception(
-						f"Error while executing function {funcName}: called from key press {key}."
-					)
+		func = self.keyHandlers.get(key)
+		if func is not None:
+			try:
+				func(symbol, modifiers)
+			except Exception:
+				logger.exception(
+					f"Error while executing function {func.__name__}: called from key press {key}."
+				)
 
 	def on_mouse_leave(self, x: int, y: int) -> None:
 		"""
@@ -986,7 +1082,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			button: The mouse button that was pressed.
 			modifiers: Bitwise combination of any keyboard modifiers currently active.
 		"""
-		logger.debug(f"Mouse press on {x} {y}, buttons: {buttons}, modifiers: {modifiers}")
+		logger.debug("Mouse press on %s %s, buttons: %s, modifiers: %s", x, y, buttons, modifiers)
 		if buttons == pyglet.window.mouse.MIDDLE:
 			self.keyboard_resetZoom(key.ESCAPE, 0)
 			return
@@ -1039,18 +1135,37 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			width: The new width of the window, in pixels.
 			height: The new height of the window, in pixels.
 		"""
-		logger.debug(f"resizing window to ({width}, {height})")
+		logger.debug("resizing window to (%s, %s)", width, height)
+		self._cp = None
+		self._roomDrawRadius = None
 		super().on_resize(width, height)
 		if self.currentRoom is not None:
 			self.on_guiRefresh()
 
 	def redraw(self) -> None:
-		"""Redraws the map view."""
+		"""
+		Redraws the map view.
+
+		The redraw is skipped if nothing affecting the view has changed since the last one.
+		"""
+		signature: Union[tuple[str, int, int, int, int], None] = None
+		if self.currentRoom is not None:
+			signature = (
+				self.currentRoom.vnum,
+				self.world.roomsGeneration,
+				self.roomSize,
+				self.width,
+				self.height,
+			)
+			if signature == self._lastRedraw and self.centerMark:
+				logger.debug("Map view unchanged, skipping redraw.")
+				return
 		logger.debug("Redrawing map view.")
 		if not self.centerMark:
 			self.drawCenterMark()
 		with self.world.roomsLock:
 			self.drawRooms()
+		self._lastRedraw = signature
 
 	def on_guiRefresh(self) -> None:
 		"""Fires when it is necessary to clear the visible rooms cache and redraw the map view."""
@@ -1062,6 +1177,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		self.deleteStaleRooms()
 		logger.debug("Clearing center mark.")
 		self.deleteCenterMark()
+		self._lastRedraw = None
 		self.redraw()
 		logger.debug("GUI refreshed.")
 
@@ -1076,7 +1192,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			currentRoom: The updated value of `world.currentRoom`.
 		"""
 		self.currentRoom = currentRoom
-		logger.debug(f"Map synced to {currentRoom}")
+		logger.debug("Map synced to %s", currentRoom)
 		self.redraw()
 
 	def guiQueueDispatcher(self, dt: float) -> None:
@@ -1086,12 +1202,14 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		Args:
 			dt: The Time delta in seconds since the last clock tick.
 		"""
-		while not self._gui_queue.empty():
-			with suppress(QueueEmpty):
-				event = self._gui_queue.get_nowait()
-				if event is None:
-					event = ("on_close",)
-				self.dispatch_event(event[0], *event[1:])
+		events: list[GUI_QUEUE_EVENT_TYPE] = []
+		with suppress(QueueEmpty):
+			while True:
+				events.append(self._gui_queue.get_nowait())
+		for event in events:
+			if event is None:
+				event = ("on_close",)
+			self.dispatch_event(event[0], *event[1:])
 
 
 Window.register_event_type("on_mapSync")
@@ -19,7 +19,7 @@ import pyglet
 
 # Local Modules:
 from ..roomdata.objects import Room
-from ..typedef import GUI_QUEUE_TYPE
+from ..typedef import GUI_QUEUE_EVENT_TYPE, GUI_QUEUE_TYPE
 from ..utils import getDataPath
 
 
@@ -158,26 +158,28 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		pyglet.clock.schedule_interval_soft(self.queue_observer, 1.0 / FPS)
 
 	def queue_observer(self, dt: float) -> None:
-		while not self._gui_queue.empty():
-			with suppress(QueueEmpty):
-				event = self._gui_queue.get_nowait()
-				if event is None:
-					event = ("on_close",)
-				self.dispatch_event(event[0], *event[1:])
+		events: list[GUI_QUEUE_EVENT_TYPE] = []
+		with suppress(QueueEmpty):
+			while True:
+				events.append(self._gui_queue.get_nowait())
+		for event in events:
+			if event is None:
+				event = ("on_close",)
+			self.dispatch_event(event[0], *event[1:])
 
 	def on_close(self) -> None:
-		logger.debug(f"Closing window {self}")
+		logger.debug("Closing window %s", self)
 		super().on_close()
 
 	def on_draw(self) -> None:
-		logger.debug(f"Drawing window {self}")
+		logger.debug("Drawing window %s", self)
 		# pyglet stuff to clear the window
 		self.clear()
 		# pyglet stuff to print the batch of sprites
 		self.batch.draw()
 
 	def on_resize(self, width: int, height: int) -> None:
-		logger.debug(f"Resizing window {self}")
+		logger.debug("Resizing window %s", self)
 		super().on_resize(width, height)
 		# reset window size
 		self.col = int(width / self.square)
@@ -189,7 +191,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			self.draw_map(self.centerRoom)
 
 	def on_mapSync(self, currentRoom: Room) -> None:
-		logger.debug(f"Map synced to {currentRoom}, vnum {currentRoom.vnum}")
+		logger.debug("Map synced to %s, vnum %s", currentRoom, currentRoom.vnum)
 		# reset player position, center the map around
 		self.playerRoom = currentRoom
 		self.draw_map(currentRoom)
@@ -204,7 +206,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			logger.debug("Unable to refresh the GUI. The center room is not defined.")
 
 	def draw_map(self, centerRoom: Room) -> None:
-		logger.debug(f"Drawing rooms around {centerRoom}")
+		logger.debug("Drawing rooms around %s", centerRoom)
 		# reset the recorded state of the window
 		self.sprites.clear()
 		self.visibleRooms.clear()
@@ -223,7 +225,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		self.draw_player()
 
 	def draw_room(self, x: int, y: int, room: Room) -> None:
-		logger.debug(f"Drawing room: {x} {y} {room}")
+		logger.debug("Drawing room: %s %s %s", x, y, room)
 		self.visibleRooms[x, y] = room
 		# draw the terrain on layer 0
 		if room.light == "dark":
@@ -260,7 +262,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 	def draw_player(self) -> None:
 		if self.playerRoom is None or self.centerRoom is None:
 			return
-		logger.debug(f"Drawing player on room vnum {self.playerRoom.vnum}")
+		logger.debug("Drawing player on room vnum %s", self.playerRoom.vnum)
 		# transform map coordinates to window ones
 		x: int = self.playerRoom.x - self.centerRoom.x + self.mcol
 		y: int = self.playerRoom.y - self.centerRoom.y + self.mrow
@@ -271,7 +273,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 			self.draw_tile(x, y, 3, "player")
 
 	def draw_tile(self, x: int, y: int, z: int, tile: str) -> None:
-		logger.debug(f"Drawing tile: {x} {y} {tile}")
+		logger.debug("Drawing tile: %s %s %s", x, y, tile)
 		# pyglet stuff to add a sprite to the batch
 		sprite: SpriteType
 		sprite = pyglet.sprite.Sprite(TILES[tile], batch=self.batch, group=self.layer[z])
@@ -282,7 +284,7 @@ class Window(pyglet.window.Window):  # type: ignore[misc, no-any-unimported]
 		self.sprites.append(sprite)
 
 	def on_mouse_press(self, wx: int, wy: int, buttons: int, modifiers: int) -> None:
-		logger.debug(f"Mouse press on {wx} {wy}.")
+		logger.debug("Mouse press on %s %s.", wx, wy)
 		x: int = int(wx / self.square)
 		y: int = int(wy / self.square)
 		# check if the player clicked on a room
@@ -57,7 +57,11 @@ class Player(threading.Thread):
 			try:
 				data = self.player.recv(4096)
 				if data:
-					self.mapper.proxy.player.parse(data)
+					self.mapper.proxy.beginBatch()
+					try:
+						self.mapper.proxy.player.parse(data)
+					finally:
+						self.mapper.proxy.flushBatch()
 				else:
 					self.close()
 			except socket.timeout:  # NOQA: PERF203
@@ -86,7 +90,11 @@ class Game(threading.Thread):
 			try:
 				data = self.game.recv(4096)
 				if data:
-					self.mapper.proxy.game.parse(data)
+					self.mapper.proxy.beginBatch()
+					try:
+						self.mapper.proxy.game.parse(data)
+					finally:
+						self.mapper.proxy.flushBatch()
 				else:
 					self.close()
 			except FakeSocketEmptyError:  # NOQA: PERF203
@@ -185,7 +193,8 @@ def main(
 	unbufferedGameSocket: Union[socket.socket, FakeSocket]
 	try:
 		if isEmulatingOffline:
-			unbufferedGameSocket = FakeSocket()
+			# The lag keeps the game thread from spinning while there is no emulated output.
+			unbufferedGameSocket = FakeSocket(lag=0.005)
 		else:
 			unbufferedGameSocket = socket.create_connection((remoteHost, remotePort))
 	except TimeoutError:
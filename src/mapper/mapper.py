@@ -20,7 +20,7 @@ from typing import Any, Optional, Union, cast
 
 # Third-party Modules:
 from knickknacks.databytes import decodeBytes
-from knickknacks.strings import formatDocString, regexFuzzy, removePrefix, simplified, stripAnsi
+from knickknacks.strings import formatDocString, removePrefix, simplified, stripAnsi
 from knickknacks.xml import escapeXMLString, getXMLAttributes
 from mudproto.mpi import MPIProtocol
 
@@ -40,7 +40,7 @@ from .typedef import (
 	REGEX_MATCH,
 	REGEX_PATTERN,
 )
-from .world import LIGHT_SYMBOLS, RUN_DESTINATION_REGEX, World
+from .world import FUZZY_DIRECTIONS_PATTERN, LIGHT_SYMBOLS, RUN_DESTINATION_REGEX, World
 
 
 EXIT_TAGS_REGEX: REGEX_PATTERN = re.compile(
@@ -127,6 +127,9 @@ MOVEMENT_PREVENTED_REGEX: REGEX_PATTERN = re.compile(
 		)
 	)
 )
+HELP_TEXT_WRAPPER: textwrap.TextWrapper = textwrap.TextWrapper(
+	width=79, break_long_words=False, break_on_hyphens=False
+)
 
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -379,7 +382,7 @@ class Mapper(threading.Thread, World):
 	def emulation_command_help(self, *args: str) -> tuple[str, ...]:
 		"""Shows documentation for mapper's emulation commands."""
 		helpTexts: list[tuple[str, str]] = [
-			(funcName, getattr(self, "emulation_command_" + funcName).__doc__)
+			(funcName, getattr(self, "emulation_command_" + funcName).__doc__ or "")
 			for funcName in self.emulationCommands
 		]
 		documentedFuncs: list[tuple[str, str]] = [
@@ -396,12 +399,7 @@ class Mapper(threading.Thread, World):
 			result.append("The following commands have no documentation yet.")
 			result.append(
 				textwrap.indent(
-					textwrap.fill(
-						", ".join(helpText[0] for helpText in undocumentedFuncs),
-						width=79,
-						break_long_words=False,
-						break_on_hyphens=False,
-					),
+					HELP_TEXT_WRAPPER.fill(", ".join(helpText[0] for helpText in undocumentedFuncs)),
 					prefix="    ",
 				)
 			)
@@ -506,7 +504,7 @@ class Mapper(threading.Thread, World):
 			self.sendGame(self.clock.time(args[0].strip().lower()))
 
 	def user_command_secretaction(self, *args: str) -> None:
-		matchPattern: str = rf"^\s*(?P<action>.+?)(?:\s+(?P<direction>{regexFuzzy(DIRECTIONS)}))?$"
+		matchPattern: str = rf"^\s*(?P<action>.+?)(?:\s+(?P<direction>{FUZZY_DIRECTIONS_PATTERN}))?$"
 		match: REGEX_MATCH = re.match(matchPattern, args[0].strip().lower())
 		if match is None:
 			self.sendPlayer(f"Syntax: 'secretaction [action] [{' | '.join(DIRECTIONS)}]'.")
@@ -763,12 +761,7 @@ class Mapper(threading.Thread, World):
 			result.append("Undocumented Commands:")
 			result.append(
 				textwrap.indent(
-					textwrap.fill(
-						", ".join(helpText[0] for helpText in undocumentedFuncs),
-						width=79,
-						break_long_words=False,
-						break_on_hyphens=False,
-					),
+					HELP_TEXT_WRAPPER.fill(", ".join(helpText[0] for helpText in undocumentedFuncs)),
 					prefix="    ",
 				)
 			)
@@ -963,7 +956,7 @@ class Mapper(threading.Thread, World):
 		)
 		self.rooms[vnum] = newRoom
 		if movement not in self.currentRoom.exits:
-			self.currentRoom.exits[movement] = self.getNewExit(movement, to=vnum)
+			self.currentRoom.exits[movement] = self.getNewExit(movement, vnum)
 		else:
 			self.currentRoom.exits[movement].to = vnum
 		self.sendPlayer(f"Adding room '{newRoom.name}' with vnum '{vnum}'")
@@ -1171,9 +1164,10 @@ class Mapper(threading.Thread, World):
 			if self.autoMapping and self.autoUpdateRooms:
 				self.updateRooms()
 		if self.autoMapping and self.isSynced and self.moved and self.exits:
-			if addedNewRoomFrom and REVERSE_DIRECTIONS[self.moved] in self.exits:
-				self.currentRoom.exits[REVERSE_DIRECTIONS[self.moved]] = self.getNewExit(
-					REVERSE_DIRECTIONS[self.moved], to=addedNewRoomFrom
+			reversedDirection: str = REVERSE_DIRECTIONS[self.moved]
+			if addedNewRoomFrom and reversedDirection in self.exits:
+				self.currentRoom.exits[reversedDirection] = self.getNewExit(
+					reversedDirection, addedNewRoomFrom
 				)
 			self.updateExitFlags(self.exits)
 		self.exits = None
@@ -1193,14 +1187,16 @@ class Mapper(threading.Thread, World):
 			getattr(self, f"user_command_{userCommand}")(args)
 
 	def handleMudEvent(self, event: str, text: str) -> None:
-		text = stripAnsi(text)
+		if "\x1b" in text:
+			# Only pay for the regex substitution when there could be ANSI sequences to remove.
+			text = stripAnsi(text)
 		if event in self.mudEventHandlers:
 			if not self.scouting or event in ("prompt", "movement"):
 				for handler in self.mudEventHandlers[event]:
 					handler(text)
 		elif event not in self.unknownMudEvents:
 			self.unknownMudEvents.append(event)
-			logger.debug(f"received data with an unknown event type of {event}")
+			logger.debug("received data with an unknown event type of %s", event)
 
 	def registerMudEventHandler(self, event: str, handler: MUD_EVENT_HANDLER_TYPE) -> None:
 		"""
@@ -1226,14 +1222,21 @@ class Mapper(threading.Thread, World):
 				del self.mudEventHandlers[event]
 
 	def run(self) -> None:
+		# Bind the per-item callables to locals once, rather than looking them up on every queue item.
+		handleUserInput = self.handleUserInput
+		handleMudEvent = self.handleMudEvent
 		for item in iter(self.queue.get, None):
 			try:
 				event, data = item
 				text = decodeBytes(data)
+				# User commands can edit any room, and auto-mapping edits rooms in response to MUD events.
 				if event == "userInput":
-					self.handleUserInput(text)
+					self.roomsGeneration += 1
+					handleUserInput(text)
 				else:
-					self.handleMudEvent(event, text)
+					if self.autoMapping:
+						self.roomsGeneration += 1
+					handleMudEvent(event, text)
 			except Exception:  # NOQA: PERF203
 				self.output(f"Error in mapper thread:\n{traceback.format_exc().strip()}")
 				logger.exception("Error in mapper thread")
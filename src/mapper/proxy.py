@@ -9,6 +9,7 @@ from __future__ import annotations
 # Built-in Modules:
 import json
 import logging
+import threading
 from collections.abc import Iterable
 from typing import Any, Union, cast
 
@@ -69,12 +70,16 @@ class Telnet(TelnetProtocol):
 
 class Player(GMCPMixIn, Telnet):
 	def __init__(self, *args: Any, **kwargs: Any) -> None:
+		self._game: Union[Game, None] = None
 		super().__init__(*args, name="player", **kwargs)
 		self._mpmGMCP: bool = False
 
 	@property
 	def game(self) -> Game:
-		return cast(Game, self.proxy.game._handlers[0])
+		# The game handler never changes once registered, so look it up only once.
+		if self._game is None:
+			self._game = cast(Game, self.proxy.game._handlers[0])
+		return self._game
 
 	def gmcpSend(self, *args: Any, **kwargs: Any) -> None:
 		if self.isGMCPInitialized:
@@ -129,13 +134,17 @@ class Player(GMCPMixIn, Telnet):
 
 class Game(MCCPMixIn, GMCPMixIn, CharsetMixIn, NAWSMixIn, Telnet):
 	def __init__(self, *args: Any, **kwargs: Any) -> None:
+		self._player: Union[Player, None] = None
 		super().__init__(*args, name="game", gmcpClientInfo=("MPM", __version__), **kwargs)
 		self._gmcpBuffer: list[tuple[str, bytes, bool]] = []
 		self.commandMap[GA] = self.on_ga
 
 	@property
 	def player(self) -> Player:
-		return cast(Player, self.proxy.player._handlers[0])
+		# The player handler never changes once registered, so look it up only once.
+		if self._player is None:
+			self._player = cast(Player, self.proxy.player._handlers[0])
+		return self._player
 
 	def on_ga(self, *args: Union[bytes, None]) -> None:
 		"""Called when a Go Ahead command is received."""
@@ -177,7 +186,30 @@ class XMLProtocol(_XMLProtocol):
 		self.eventCaller((name, data))
 
 
+class BatchState(threading.local):
+	"""Per-thread state for batching writes in a ProxyHandler."""
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.depth: int = 0
+		self.playerWrites: bytearray = bytearray()
+		self.gameWrites: bytearray = bytearray()
+
+
 class ProxyHandler:
+	__slots__: tuple[str, ...] = (
+		"outputFormat",
+		"isEmulatingOffline",
+		"mapperCommands",
+		"playerInputBuffer",
+		"eventCaller",
+		"player",
+		"game",
+		"_playerWriter",
+		"_gameWriter",
+		"_batch",
+	)
+
 	def __init__(
 		self,
 		playerWriter: PLAYER_WRITER_TYPE,
@@ -191,15 +223,18 @@ class ProxyHandler:
 	) -> None:
 		self.outputFormat: str = outputFormat
 		self.isEmulatingOffline: bool = isEmulatingOffline
-		self.mapperCommands: Iterable[bytes] = mapperCommands
+		self.mapperCommands: frozenset[bytes] = frozenset(mapperCommands)
 		self.playerInputBuffer: bytearray = bytearray()
 		self.eventCaller: MUD_EVENT_CALLER_TYPE = eventCaller
+		self._playerWriter: PLAYER_WRITER_TYPE = playerWriter
+		self._gameWriter: GAME_WRITER_TYPE = gameWriter
+		self._batch: BatchState = BatchState()
 		self.player: Manager = Manager(
-			playerWriter, self.on_playerReceived, isClient=False, promptTerminator=promptTerminator
+			self._writeToPlayer, self.on_playerReceived, isClient=False, promptTerminator=promptTerminator
 		)
 		self.player.register(Player, proxy=self)
 		self.game: Manager = Manager(
-			gameWriter, self.on_gameReceived, isClient=True, promptTerminator=promptTerminator
+			self._writeToGame, self.on_gameReceived, isClient=True, promptTerminator=promptTerminator
 		)
 		self.game.register(Game, proxy=self)
 		self.game.register(MPIProtocol, outputFormat=self.outputFormat)
@@ -220,16 +255,60 @@ class ProxyHandler:
 		self.game.disconnect()
 		self.player.disconnect()
 
+	def beginBatch(self) -> None:
+		"""
+		Starts buffering writes made by the calling thread to both sides of the proxy.
+
+		Data written while a batch is active is sent with a single call to the underlying writer
+		of each side when the calling thread's outermost batch is flushed.
+		Writes made by other threads are not affected.
+		"""
+		self._batch.depth += 1
+
+	def flushBatch(self) -> None:
+		"""Ends a batch started by beginBatch, sending any buffered data if it was the outermost batch."""
+		batch: BatchState = self._batch
+		batch.depth -= 1
+		if batch.depth > 0:
+			return
+		data: bytes
+		try:
+			if batch.playerWrites:
+				data = bytes(batch.playerWrites)
+				batch.playerWrites.clear()
+				self._playerWriter(data)
+		finally:
+			# A failed write to the player must not lose the data bound for the game.
+			if batch.gameWrites:
+				data = bytes(batch.gameWrites)
+				batch.gameWrites.clear()
+				self._gameWriter(data)
+
+	def _writeToPlayer(self, data: bytes) -> None:
+		batch: BatchState = self._batch
+		if batch.depth:
+			batch.playerWrites.extend(data)
+		else:
+			self._playerWriter(data)
+
+	def _writeToGame(self, data: bytes) -> None:
+		batch: BatchState = self._batch
+		if batch.depth:
+			batch.gameWrites.extend(data)
+		else:
+			self._gameWriter(data)
+
 	def on_playerReceived(self, data: bytes) -> None:
 		if self.playerInputBuffer:
-			data = bytes(self.playerInputBuffer + data)
+			data = b"".join((self.playerInputBuffer, data))
 			self.playerInputBuffer.clear()
 		for line in data.splitlines(keepends=True):
 			if line[-1] not in CR_LF:
 				# Final line was incomplete.
 				self.playerInputBuffer.extend(line)
 				break
-			if self.isEmulatingOffline or b"".join(line.strip().split()[:1]) in self.mapperCommands:
+			words: list[bytes] = line.split(None, 1)
+			if self.isEmulatingOffline or words and words[0] in self.mapperCommands:
 				self.eventCaller(("userInput", line))
 			else:
 				self.game.write(line, escape=True)
@@ -7,8 +7,11 @@
 from __future__ import annotations
 
 # Built-in Modules:
+import hashlib
 import logging
-import os.path
+import mmap
+import os
+import stat
 from collections.abc import Callable, Mapping
 from functools import lru_cache
 from typing import Any, Union
@@ -33,6 +36,8 @@ MAP_FILE: str = "map.json"
 MAP_FILE_PATH: str = os.path.join(DATA_DIRECTORY, MAP_FILE)
 SAMPLE_MAP_FILE: str = MAP_FILE + ".sample"
 SAMPLE_MAP_FILE_PATH: str = os.path.join(DATA_DIRECTORY, SAMPLE_MAP_FILE)
+MMAP_THRESHOLD: int = 1024 * 1024  # Database files larger than this many bytes are memory-mapped when loaded.
+VALIDATED_DIGEST_SUFFIX: str = ".validated"  # Appended to a database path to get its validation record path.
 
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -60,19 +65,70 @@ def getValidator(schemaPath: str) -> Callable[..., None]:  # type: ignore[misc]
 	return validator
 
 
-def _validate(database: Mapping[str, Any], schemaPath: str) -> None:
+def _validate(database: Mapping[str, Any], schemaPath: str) -> bool:
 	"""
 	Validates a database against a schema.
 
 	Args:
 		database: The database to be validated.
 		schemaPath: The location of the schema.
+
+	Returns:
+		True if the database is valid, False otherwise.
 	"""
 	validator = getValidator(schemaPath)
 	try:
 		validator(database)
 	except fastjsonschema.JsonSchemaException as e:
 		logger.exception(f"Data failed validation: {e}")
+		return False
+	return True
+
+
+def _getSchemaDigest(schemaPath: str) -> bytes:
+	"""
+	Calculates the digest of a schema's contents.
+
+	Args:
+		schemaPath: The location of the schema.
+
+	Returns:
+		The digest.
+	"""
+	with open(schemaPath, "rb") as fileObj:
+		return hashlib.sha256(fileObj.read()).digest()
+
+
+def _getValidatedDigest(databasePath: str) -> Union[str, None]:
+	"""
+	Retrieves the digest of the database contents which last passed validation.
+
+	Args:
+		databasePath: The location of the database.
+
+	Returns:
+		The hex digest, or None if no validation record could be read.
+	"""
+	try:
+		with open(databasePath + VALIDATED_DIGEST_SUFFIX, "r", encoding="us-ascii") as fileObj:
+			return fileObj.read().strip()
+	except (IOError, UnicodeDecodeError):
+		return None
+
+
+def _setValidatedDigest(databasePath: str, digest: str) -> None:
+	"""
+	Records the digest of database contents which passed validation.
+
+	Args:
+		databasePath: The location of the database.
+		digest: The hex digest of the database contents.
+	"""
+	try:
+		with open(databasePath + VALIDATED_DIGEST_SUFFIX, "w", encoding="us-ascii") as fileObj:
+			fileObj.write(digest)
+	except IOError as e:
+		logger.debug("Unable to record validation of '%s': %s", databasePath, e)
 
 
 def _load(databasePath: str) -> Union[tuple[str, None, int], tuple[None, dict[str, Any], int]]:
@@ -85,16 +141,36 @@ def _load(databasePath: str) -> Union[tuple[str, None, int], tuple[None, dict[st
 	Returns:
 		An error message or None, the loaded database or None, and the schema version.
 	"""
-	if not os.path.exists(databasePath):
+	# A single stat call covers the existence, type, and size checks.
+	try:
+		status: os.stat_result = os.stat(databasePath)
+	except OSError:
 		return f"Error: '{databasePath}' doesn't exist.", None, 0
-	if os.path.isdir(databasePath):
+	if stat.S_ISDIR(status.st_mode):
 		return f"Error: '{databasePath}' is a directory, not a file.", None, 0
 	try:
+		database: dict[str, Any]
+		digest: hashlib._Hash
 		with open(databasePath, "rb") as fileObj:
-			database: dict[str, Any] = orjson.loads(fileObj.read())
+			if status.st_size > MMAP_THRESHOLD:
+				# Parse large files directly from the mapping rather than reading a copy into memory first.
+				fileno: int = fileObj.fileno()
+				with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+					database = orjson.loads(view)
+					digest = hashlib.sha256(view)
+			else:
+				data: bytes = fileObj.read()
+				database = orjson.loads(data)
+				digest = hashlib.sha256(data)
 		schemaVersion: int = database.get("schema_version", 0)
 		schemaPath = getSchemaPath(databasePath, schemaVersion)
-		_validate(database, schemaPath)
+		# Validation is slow for large databases, so skip it if these exact contents were already validated.
+		# The schema contents are included, so that a changed schema causes the database to be revalidated.
+		digest.update(schemaPath.encode("utf-8"))
+		digest.update(_getSchemaDigest(schemaPath))
+		hexDigest: str = digest.hexdigest()
+		if _getValidatedDigest(databasePath) != hexDigest and _validate(database, schemaPath):
+			_setValidatedDigest(databasePath, hexDigest)
 		database.pop("schema_version", None)
 		return None, database, schemaVersion
 	except IOError as e:
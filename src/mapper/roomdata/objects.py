@@ -7,14 +7,15 @@
 from __future__ import annotations
 
 # Built-in Modules:
+import math
 import re
 import sys
 from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Union
 
 # Local Modules:
-from ..gui.vec2d import Vec2d
 from ..typedef import COORDINATES_TYPE, REGEX_PATTERN
 
 
@@ -26,6 +27,7 @@ DIRECTIONS: tuple[str, ...] = (
 	"up",
 	"down",
 )
+DIRECTION_INDEXES: dict[str, int] = {direction: index for index, direction in enumerate(DIRECTIONS)}
 REVERSE_DIRECTIONS: dict[str, str] = {
 	"north": "south",
 	"south": "north",
@@ -163,6 +165,22 @@ if sys.version_info >= (3, 10):  # pragma: no cover
 	DATACLASS_KWARGS["slots"] = True
 
 
+@lru_cache(maxsize=1024)
+def _isAvoidedDynamicDesc(dynamicDesc: str) -> bool:
+	"""
+	Determines if a dynamic description contains something that should be avoided.
+
+	The same dynamic descriptions recur across many rooms, so results are cached.
+
+	Args:
+		dynamicDesc: The dynamic description of a room.
+
+	Returns:
+		True if the dynamic description matches AVOID_DYNAMIC_DESC_REGEX, False otherwise.
+	"""
+	return AVOID_DYNAMIC_DESC_REGEX.search(dynamicDesc) is not None
+
+
 @dataclass(**DATACLASS_KWARGS)
 class Exit:
 	"""
@@ -257,50 +275,56 @@ class Room:
 		"""The room exits, sorted by direction."""
 		return sorted(
 			self.exits.items(),
-			key=lambda item: (DIRECTIONS.index(item[0]) if item[0] in DIRECTIONS else len(DIRECTIONS)),
+			key=lambda item: DIRECTION_INDEXES.get(item[0], len(DIRECTIONS)),
 		)
 
 	@property
 	def info(self) -> str:
 		"""A summery of the room info."""
-		output: list[str] = []
-		output.append(f"vnum: '{self.vnum}'")
-		output.append(f"Name: '{self.name}'")
-		output.append(f"Server ID: '{self.serverID}'")
-		output.append("Description:")
-		output.append("-" * 5)
-		output.extend(self.desc.splitlines())
-		output.append("-" * 5)
-		output.append("Dynamic Desc:")
-		output.append("-" * 5)
-		output.extend(self.dynamicDesc.splitlines())
-		output.append("-" * 5)
-		output.append(f"Note: '{self.note}'")
-		output.append(f"Area: '{self.area}'")
-		output.append(f"Terrain: '{self.terrain}'")
-		output.append(f"Cost: '{self.cost}'")
-		output.append(f"Light: '{self.light}'")
-		output.append(f"Align: '{self.align}'")
-		output.append(f"Portable: '{self.portable}'")
-		output.append(f"Ridable: '{self.ridable}'")
-		output.append(f"Sundeath: '{self.sundeath}'")
-		output.append(f"Mob Flags: '{', '.join(self.mobFlags)}'")
-		output.append(f"Load Flags: '{', '.join(self.loadFlags)}'")
-		output.append(f"Coordinates (X, Y, Z): '{self.coordinates}'")
-		output.append("Exits:")
+		separator: str = "-" * 5
+		output: list[str] = [
+			f"vnum: '{self.vnum}'",
+			f"Name: '{self.name}'",
+			f"Server ID: '{self.serverID}'",
+			"Description:",
+			separator,
+			*self.desc.splitlines(),
+			separator,
+			"Dynamic Desc:",
+			separator,
+			*self.dynamicDesc.splitlines(),
+			separator,
+			f"Note: '{self.note}'",
+			f"Area: '{self.area}'",
+			f"Terrain: '{self.terrain}'",
+			f"Cost: '{self.cost}'",
+			f"Light: '{self.light}'",
+			f"Align: '{self.align}'",
+			f"Portable: '{self.portable}'",
+			f"Ridable: '{self.ridable}'",
+			f"Sundeath: '{self.sundeath}'",
+			f"Mob Flags: '{', '.join(self.mobFlags)}'",
+			f"Load Flags: '{', '.join(self.loadFlags)}'",
+			f"Coordinates (X, Y, Z): '{self.coordinates}'",
+			"Exits:",
+		]
 		for direction, exitObj in self.sortedExits:
-			output.append("-" * 5)
-			output.append(f"Direction: '{direction}'")
-			output.append(f"To: '{exitObj.to}'")
-			output.append(f"Exit Flags: '{', '.join(exitObj.exitFlags)}'")
-			output.append(f"Door Name: '{exitObj.door}'")
-			output.append(f"Door Flags: '{', '.join(exitObj.doorFlags)}'")
+			output.extend(
+				(
+					separator,
+					f"Direction: '{direction}'",
+					f"To: '{exitObj.to}'",
+					f"Exit Flags: '{', '.join(exitObj.exitFlags)}'",
+					f"Door Name: '{exitObj.door}'",
+					f"Door Flags: '{', '.join(exitObj.doorFlags)}'",
+				)
+			)
 		return "\n".join(output)
 
 	def calculateCost(self) -> None:
 		"""Calculates the movement cost for the room."""
 		self.cost = TERRAIN_COSTS[self.terrain]
-		if self.avoid or AVOID_DYNAMIC_DESC_REGEX.search(self.dynamicDesc):
+		if self.avoid or self.dynamicDesc and _isAvoidedDynamicDesc(self.dynamicDesc):
 			self.cost += 1000.0
 		if self.ridable == "not_ridable":
 			self.cost += 5.0
@@ -333,12 +357,14 @@ class Room:
 		Returns:
 			The clock position of the other room, relative to this one.
 		"""
-		delta = Vec2d(other.x, other.y) - (self.x, self.y)
 		if self.vnum == other.vnum:
 			return "here"
-		if delta.get_length_sqrd() == 0:
+		deltaX: int = other.x - self.x
+		deltaY: int = other.y - self.y
+		if deltaX == deltaY == 0:
 			return "same X-Y"
-		position = int(round((90 - delta.angle_degrees + 360) % 360 / 30)) or 12
+		angle: float = math.degrees(math.atan2(deltaY, deltaX))
+		position = int(round((90 - angle + 360) % 360 / 30)) or 12
 		return f"{position} o'clock"
 
 	def directionTo(self, other: Room) -> str:
@@ -354,12 +380,14 @@ class Room:
 		Returns:
 			The compass direction of the other room, relative to this one.
 		"""
-		delta = Vec2d(other.x, other.y) - (self.x, self.y)
 		if self.vnum == other.vnum:
 			return "here"
-		if delta.get_length_sqrd() == 0:
+		deltaX: int = other.x - self.x
+		deltaY: int = other.y - self.y
+		if deltaX == deltaY == 0:
 			return "same X-Y"
-		return COMPASS_DIRECTIONS[round((90 - delta.angle_degrees + 360) % 360 / 45) % 8]
+		angle: float = math.degrees(math.atan2(deltaY, deltaX))
+		return COMPASS_DIRECTIONS[round((90 - angle + 360) % 360 / 45) % 8]
 
 	def isOrphan(self) -> bool:
 		"""
@@ -8,10 +8,11 @@ from __future__ import annotations
 
 # Built-in Modules:
 import logging
-import select
+import selectors
 import socket
 import ssl
 from contextlib import AbstractContextManager
+from functools import lru_cache
 from typing import Any, Union, cast
 
 # Third-party Modules:
@@ -28,6 +29,21 @@ CERT_LOCATION: str = certifi.where()
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def getSSLContext() -> ssl.SSLContext:
+	"""
+	Retrieves the SSL context used for encrypted connections.
+
+	The context is only created on the first call, as loading the certificate bundle is expensive.
+
+	Returns:
+		The SSL context.
+	"""
+	context: ssl.SSLContext = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+	context.load_verify_locations(CERT_LOCATION)
+	return context
+
+
 class BufferedSocket(socketutils.BufferedSocket):
 	_recv_lock: AbstractContextManager[None]
 	_send_lock: AbstractContextManager[None]
@@ -78,9 +94,7 @@ class BufferedSocket(socketutils.BufferedSocket):
 			originalTimeout: Union[float, None] = sock.gettimeout()
 			sock.settimeout(None)
 			try:
-				context: ssl.SSLContext = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-				context.load_verify_locations(CERT_LOCATION)
-				sock = context.wrap_socket(sock, **kwargs)
+				sock = getSSLContext().wrap_socket(sock, **kwargs)
 				self.doSSLHandshake(sock)
 			finally:
 				sock.settimeout(originalTimeout)
@@ -100,11 +114,16 @@ class BufferedSocket(socketutils.BufferedSocket):
 		Args:
 			sock: The socket to perform the handshake on.
 		"""
-		while True:
-			try:
-				sock.do_handshake()
-				break
-			except ssl.SSLWantReadError:
-				select.select([sock], [], [])
-			except ssl.SSLWantWriteError:
-				select.select([], [sock], [])
+		with selectors.DefaultSelector() as selector:
+			# The socket stays registered for the whole handshake, only changing the events waited on.
+			selector.register(sock, selectors.EVENT_READ)
+			while True:
+				try:
+					sock.do_handshake()
+					break
+				except ssl.SSLWantReadError:
+					selector.modify(sock, selectors.EVENT_READ)
+					selector.select()
+				except ssl.SSLWantWriteError:
+					selector.modify(sock, selectors.EVENT_WRITE)
+					selector.select()
@@ -20,9 +20,18 @@ class FakeSocketEmptyError(Exception):
 
 
 class FakeSocket:
-	def __init__(self, *args: Any, **kwargs: Any) -> None:
+	def __init__(self, *args: Any, lag: float = 0.0, **kwargs: Any) -> None:
+		"""
+		Defines the constructor for the object.
+
+		Args:
+			*args: Ignored.
+			lag: The number of seconds each call to recv should sleep for, simulating network lag.
+			**kwargs: Ignored.
+		"""
 		self.inboundBuffer: Union[bytes, None] = None
 		self.timeout: Union[float, None] = None
+		self.lag: float = lag
 
 	def gettimeout(self) -> Union[float, None]:
 		return self.timeout
@@ -60,10 +69,11 @@ class FakeSocket:
 		self.send(data, flags)
 
 	def recv(self, buffersize: int, flags: int = 0) -> bytes:
-		#  Simulate some lag.
-		time.sleep(0.005)
+		if self.lag:
+			time.sleep(self.lag)
 		if isinstance(self.inboundBuffer, bytes):
-			inboundBuffer: bytes = self.inboundBuffer
-			self.inboundBuffer = None
-			return inboundBuffer
+			# Slicing returns the same object if the whole buffer fits, so the common case does not copy.
+			data: bytes = self.inboundBuffer[:buffersize]
+			self.inboundBuffer = self.inboundBuffer[buffersize:] or None
+			return data
 		raise FakeSocketEmptyError
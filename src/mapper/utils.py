@@ -14,6 +14,10 @@ from knickknacks.platforms import getDirectoryPath, isFrozen
 
 
 DATA_DIRECTORY: str = "mapper_data"
+# The data directory does not change while the program is running, so only resolve it once.
+DATA_DIRECTORY_PATH: str = os.path.realpath(
+	getDirectoryPath(os.path.curdir if isFrozen() else os.path.pardir, DATA_DIRECTORY)
+)
 
 
 def getDataPath(*args: str) -> str:
@@ -26,5 +30,4 @@ def getDataPath(*args: str) -> str:
 	Returns:
 		The path.
 	"""
-	path: str = getDirectoryPath(os.path.curdir if isFrozen() else os.path.pardir, DATA_DIRECTORY)
-	return os.path.realpath(os.path.join(path, *args))
+	return os.path.realpath(os.path.join(DATA_DIRECTORY_PATH, *args))
@@ -11,6 +11,7 @@ import gc
 import heapq
 import itertools
 import re
+import sys
 import threading
 import warnings
 from collections.abc import Callable, Generator, Iterable, MutableSequence, Sequence
@@ -67,6 +68,9 @@ warnings.filterwarnings(
 )
 
 
+FUZZY_DIRECTIONS_PATTERN: str = regexFuzzy(DIRECTIONS)
+FUZZY_MODE_PATTERN: str = f"{regexFuzzy('add')}|{regexFuzzy('remove')}"
+FUZZY_ONEWAY_PATTERN: str = regexFuzzy("oneway")
 LEAD_BEFORE_ENTERING_VNUMS: list[str] = ["196", "3473", "3474", "12138", "12637"]
 LIGHT_SYMBOLS: dict[str, str] = {
 	"*": "lit",  # Sunlight, either direct or indirect.
@@ -97,6 +101,8 @@ TERRAIN_SYMBOLS: dict[str, str] = {
 class World:
 	def __init__(self, interface: str = "text") -> None:
 		self.roomsLock = threading.Lock()
+		# Incremented whenever the rooms may have been modified, so the GUI can tell when its view is stale.
+		self.roomsGeneration: int = 0
 		self.isSynced: bool = False
 		self.rooms: dict[str, Room] = {}
 		self.labels: dict[str, str] = {}
@@ -190,7 +196,8 @@ class World:
 			with suppress(KeyError):
 				newRoom.avoid = roomDict["avoid"]
 			newRoom.desc = roomDict["desc"]
-			newRoom.dynamicDesc = roomDict["dynamicDesc"].lstrip()
+			# Many rooms share the same dynamic description, so only keep one copy of each in memory.
+			newRoom.dynamicDesc = sys.intern(roomDict["dynamicDesc"].lstrip())
 			for direction, exitDict in roomDict["exits"].items():
 				newExit: Exit = self.getNewExit(direction, exitDict["to"], vnum)
 				newExit.door = exitDict["door"]
@@ -225,7 +232,7 @@ class World:
 			newRoom.align = roomDict["alignment"]
 			newRoom.avoid = roomDict["avoid"]
 			newRoom.desc = roomDict["description"]
-			newRoom.dynamicDesc = roomDict["contents"].lstrip()
+			newRoom.dynamicDesc = sys.intern(roomDict["contents"].lstrip())
 			for direction, exitDict in roomDict["exits"].items():
 				newExit: Exit = self.getNewExit(direction, exitDict["to"], vnum)
 				newExit.door = exitDict["door"]
@@ -845,10 +852,7 @@ class World:
 
 	def rmobflags(self, text: str = "") -> str:
 		text = text.strip().lower()
-		matchPattern: str = (
-			rf"^(?P<mode>{regexFuzzy('add')}|{regexFuzzy('remove')})"
-			+ rf"\s+(?P<flag>{'|'.join(VALID_MOB_FLAGS)})"
-		)
+		matchPattern: str = rf"^(?P<mode>{FUZZY_MODE_PATTERN})" + rf"\s+(?P<flag>{'|'.join(VALID_MOB_FLAGS)})"
 		match: REGEX_MATCH = re.match(matchPattern, text)
 		if match is not None:
 			matchDict: dict[str, str] = match.groupdict()
@@ -870,8 +874,7 @@ class World:
 	def rloadflags(self, text: str = "") -> str:
 		text = text.strip().lower()
 		matchPattern: str = (
-			rf"^(?P<mode>{regexFuzzy('add')}|{regexFuzzy('remove')})"
-			+ rf"\s+(?P<flag>{'|'.join(VALID_LOAD_FLAGS)})"
+			rf"^(?P<mode>{FUZZY_MODE_PATTERN})" + rf"\s+(?P<flag>{'|'.join(VALID_LOAD_FLAGS)})"
 		)
 		match: REGEX_MATCH = re.match(matchPattern, text)
 		if match is not None:
@@ -894,8 +897,8 @@ class World:
 	def exitflags(self, text: str = "") -> str:
 		text = text.strip().lower()
 		matchPattern: str = (
-			rf"^((?P<mode>{regexFuzzy('add')}|{regexFuzzy('remove')})\s+)?"
-			+ rf"((?P<flag>{'|'.join(VALID_EXIT_FLAGS)})\s+)?(?P<direction>{regexFuzzy(DIRECTIONS)})"
+			rf"^((?P<mode>{FUZZY_MODE_PATTERN})\s+)?"
+			+ rf"((?P<flag>{'|'.join(VALID_EXIT_FLAGS)})\s+)?(?P<direction>{FUZZY_DIRECTIONS_PATTERN})"
 		)
 		match: REGEX_MATCH = re.match(matchPattern, text)
 		if match is not None:
@@ -926,8 +929,8 @@ class World:
 	def doorflags(self, text: str = "") -> str:
 		text = text.strip().lower()
 		matchPattern: str = (
-			rf"^((?P<mode>{regexFuzzy('add')}|{regexFuzzy('remove')})\s+)?"
-			+ rf"((?P<flag>{'|'.join(VALID_DOOR_FLAGS)})\s+)?(?P<direction>{regexFuzzy(DIRECTIONS)})"
+			rf"^((?P<mode>{FUZZY_MODE_PATTERN})\s+)?"
+			+ rf"((?P<flag>{'|'.join(VALID_DOOR_FLAGS)})\s+)?(?P<direction>{FUZZY_DIRECTIONS_PATTERN})"
 		)
 		match: REGEX_MATCH = re.match(matchPattern, text)
 		if match is not None:
@@ -958,8 +961,8 @@ class World:
 	def secret(self, text: str = "") -> str:
 		text = text.strip().lower()
 		matchPattern: str = (
-			rf"^((?P<mode>{regexFuzzy('add')}|{regexFuzzy('remove')})\s+)?"
-			+ rf"((?P<name>[A-Za-z]+)\s+)?(?P<direction>{regexFuzzy(DIRECTIONS)})"
+			rf"^((?P<mode>{FUZZY_MODE_PATTERN})\s+)?"
+			+ rf"((?P<name>[A-Za-z]+)\s+)?(?P<direction>{FUZZY_DIRECTIONS_PATTERN})"
 		)
 		match: REGEX_MATCH = re.match(matchPattern, text)
 		if match is not None:
@@ -992,10 +995,10 @@ class World:
 	def rlink(self, text: str = "") -> str:
 		text = text.strip().lower()
 		matchPattern: str = (
-			rf"^((?P<mode>{regexFuzzy('add')}|{regexFuzzy('remove')})\s+)?"
-			+ rf"((?P<oneway>{regexFuzzy('oneway')})\s+)?"
+			rf"^((?P<mode>{FUZZY_MODE_PATTERN})\s+)?"
+			+ rf"((?P<oneway>{FUZZY_ONEWAY_PATTERN})\s+)?"
 			+ r"((?P<vnum>\d+|undefined)\s+)?"
-			+ rf"(?P<direction>{regexFuzzy(DIRECTIONS)})"
+			+ rf"(?P<direction>{FUZZY_DIRECTIONS_PATTERN})"
 		)
 		match: REGEX_MATCH = re.match(matchPattern, text)
 		if match is not None:
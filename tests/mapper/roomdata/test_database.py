@@ -7,6 +7,9 @@
 from __future__ import annotations
 
 # Built-in Modules:
+import hashlib
+import stat
+from contextlib import ExitStack
 from typing import Any
 from unittest import TestCase
 from unittest.mock import Mock, _CallList, call, patch
@@ -20,6 +23,7 @@ from mapper.roomdata.database import (
 	LABELS_SCHEMA_VERSION,
 	MAP_FILE_PATH,
 	MAP_SCHEMA_VERSION,
+	MMAP_THRESHOLD,
 	SAMPLE_LABELS_FILE_PATH,
 	SAMPLE_MAP_FILE_PATH,
 	_dump,
@@ -114,27 +118,26 @@ class TestDatabase(TestCase):
 
 	@patch("mapper.roomdata.database._validate")
 	@patch("mapper.roomdata.database.open")
-	@patch("mapper.roomdata.database.os.path")
-	def testLoad(self, mockOSPath: Mock, mockOpen: Mock, mockValidate: Mock) -> None:
+	@patch("mapper.roomdata.database.os.stat")
+	def testLoad(self, mockStat: Mock, mockOpen: Mock, mockValidate: Mock) -> None:
 		fileName: str = "__junk__.json"
 		schemaPath: str = MAP_SCHEMA_FILE_PATH
 		mockFileObj: Mock = Mock()
 		mockOpen.return_value.__enter__.return_value = mockFileObj
-		mockOSPath.isdir.return_value = False
 		# Test path does not exist:
-		mockOSPath.exists.return_value = False
+		mockStat.side_effect = FileNotFoundError
 		errors, database, schemaVersion = _load(fileName)
 		self.assertEqual(f"Error: '{fileName}' doesn't exist.", errors)
 		self.assertIsNone(database)
 		self.assertEqual(schemaVersion, 0)
-		mockOSPath.exists.return_value = True
+		mockStat.side_effect = None
 		# Test path is directory:
-		mockOSPath.isdir.return_value = True
+		mockStat.return_value = Mock(st_mode=stat.S_IFDIR, st_size=0)
 		errors, database, schemaVersion = _load(fileName)
 		self.assertEqual(f"Error: '{fileName}' is a directory, not a file.", errors)
 		self.assertIsNone(database)
 		self.assertEqual(schemaVersion, 0)
-		mockOSPath.isdir.return_value = False
+		mockStat.return_value.st_mode = stat.S_IFREG
 		# Test IOError:
 		mockFileObj.read.side_effect = lambda *args: (_ for _ in ()).throw(IOError("some error"))
 		errors, database, schemaVersion = _load(fileName)
@@ -148,14 +151,71 @@ class TestDatabase(TestCase):
 		self.assertIsNone(database)
 		self.assertEqual(schemaVersion, 0)
 		# Test valid data:
-		mockFileObj.read.side_effect = lambda *args: orjson.dumps(self.rooms)
-		with patch("mapper.roomdata.database.getSchemaPath", return_value=schemaPath):
+		data: bytes = orjson.dumps(self.rooms)
+		schemaDigest: bytes = hashlib.sha256(b"schema").digest()
+		digest: str = hashlib.sha256(data + schemaPath.encode("utf-8") + schemaDigest).hexdigest()
+		mockFileObj.read.side_effect = lambda *args: data
+		with ExitStack() as cm:
+			cm.enter_context(patch("mapper.roomdata.database.getSchemaPath", return_value=schemaPath))
+			cm.enter_context(patch("mapper.roomdata.database._getSchemaDigest", return_value=schemaDigest))
+			cm.enter_context(patch("mapper.roomdata.database._getValidatedDigest", return_value=None))
+			mockSetValidatedDigest: Mock = cm.enter_context(
+				patch("mapper.roomdata.database._setValidatedDigest")
+			)
 			errors, database, schemaVersion = _load(fileName)
 		self.assertIsNone(errors)
 		self.assertIsNotNone(database)
 		self.assertEqual(schemaVersion, 0)
 		mockValidate.assert_called_once_with(database, schemaPath)
+		mockSetValidatedDigest.assert_called_once_with(fileName, digest)
 		self.assertEqual(database, self.rooms)
+		# Test no validation record is written for data which fails validation:
+		mockValidate.reset_mock()
+		mockValidate.return_value = False
+		with ExitStack() as cm:
+			cm.enter_context(patch("mapper.roomdata.database.getSchemaPath", return_value=schemaPath))
+			cm.enter_context(patch("mapper.roomdata.database._getSchemaDigest", return_value=schemaDigest))
+			cm.enter_context(patch("mapper.roomdata.database._getValidatedDigest", return_value=None))
+			mockSetValidatedDigest = cm.enter_context(patch("mapper.roomdata.database._setValidatedDigest"))
+			errors, database, schemaVersion = _load(fileName)
+		mockValidate.assert_called_once_with(database, schemaPath)
+		mockSetValidatedDigest.assert_not_called()
+		mockValidate.return_value = True
+		# Test valid data in a memory-mapped file:
+		mockValidate.reset_mock()
+		mockStat.return_value.st_size = MMAP_THRESHOLD + 1
+		mockFileObj.read.side_effect = lambda *args: b"not memory-mapped"
+		with ExitStack() as cm:
+			cm.enter_context(patch("mapper.roomdata.database.getSchemaPath", return_value=schemaPath))
+			mockGetSchemaDigest: Mock = cm.enter_context(
+				patch("mapper.roomdata.database._getSchemaDigest", return_value=schemaDigest)
+			)
+			mockGetValidatedDigest: Mock = cm.enter_context(
+				patch("mapper.roomdata.database._getValidatedDigest", return_value=None)
+			)
+			mockSetValidatedDigest = cm.enter_context(patch("mapper.roomdata.database._setValidatedDigest"))
+			mockMmap: Mock = cm.enter_context(patch("mapper.roomdata.database.mmap.mmap"))
+			mockMmap.return_value.__enter__.return_value = data
+			errors, database, schemaVersion = _load(fileName)
+		self.assertIsNone(errors)
+		self.assertEqual(schemaVersion, 0)
+		mockValidate.assert_called_once_with(database, schemaPath)
+		mockGetSchemaDigest.assert_called_once_with(schemaPath)
+		mockGetValidatedDigest.assert_called_once_with(fileName)
+		mockSetValidatedDigest.assert_called_once_with(fileName, digest)
+		self.assertEqual(database, self.rooms)
+		# Test validation is skipped for data which was previously validated:
+		mockValidate.reset_mock()
+		mockStat.return_value.st_size = 0
+		mockFileObj.read.side_effect = lambda *args: data
+		with ExitStack() as cm:
+			cm.enter_context(patch("mapper.roomdata.database.getSchemaPath", return_value=schemaPath))
+			cm.enter_context(patch("mapper.roomdata.database._getSchemaDigest", return_value=schemaDigest))
+			cm.enter_context(patch("mapper.roomdata.database._getValidatedDigest", return_value=digest))
+			errors, database, schemaVersion = _load(fileName)
+		self.assertIsNone(errors)
+		self.assertEqual(database, self.rooms)
+		mockValidate.assert_not_called()
 
 	@patch("mapper.roomdata.database._validate")
 	@patch("mapper.roomdata.database.open")
@@ -50,9 +50,16 @@ class TestFakeSocket(TestCase):
 	def testRecv(self, mockTime: Mock) -> None:
 		self.fakeSocket.inboundBuffer = b"hello"
 		self.assertEqual(self.fakeSocket.recv(4096), b"hello")
-		mockTime.sleep.assert_called_once_with(0.005)
-		mockTime.reset_mock()
+		self.assertIsNone(self.fakeSocket.inboundBuffer)
+		mockTime.sleep.assert_not_called()
+		self.fakeSocket.inboundBuffer = b"hello"
+		self.assertEqual(self.fakeSocket.recv(3), b"hel")
+		self.assertEqual(self.fakeSocket.recv(3), b"lo")
+		self.assertIsNone(self.fakeSocket.inboundBuffer)
+		self.fakeSocket.inboundBuffer = b""
+		self.assertEqual(self.fakeSocket.recv(4096), b"")
+		self.assertIsNone(self.fakeSocket.inboundBuffer)
+		self.fakeSocket.lag = 0.005
 		with self.assertRaises(FakeSocketEmptyError):
-			self.fakeSocket.inboundBuffer = None
 			self.fakeSocket.recv(4096)
 		mockTime.sleep.assert_called_once_with(0.005)
@@ -9,6 +9,7 @@ from __future__ import annotations
 # Built-in Modules:
 import logging
 import socket
+import threading
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
@@ -172,6 +173,45 @@ class TestProxyHandler(TestCase):
 		self.proxy.close()
 		mockDisconnect.assert_called_once()
 
+	def testProxyHandlerBatch(self) -> None:
+		self.proxy.beginBatch()
+		self.proxy.player.write(b"Hello")
+		self.proxy.player.write(b" world!")
+		self.proxy.game.write(b"look")
+		self.assertEqual((self.playerReceives, self.gameReceives), (b"", b""))
+		self.proxy.flushBatch()
+		self.assertEqual((self.playerReceives, self.gameReceives), (b"Hello world!", b"look"))
+		self.playerReceives.clear()
+		self.gameReceives.clear()
+		# Nested batches are only sent when the outermost batch is flushed.
+		self.proxy.beginBatch()
+		self.proxy.player.write(b"outer ")
+		self.proxy.beginBatch()
+		self.proxy.player.write(b"inner")
+		self.proxy.flushBatch()
+		self.assertEqual(self.playerReceives, b"")
+		self.proxy.flushBatch()
+		self.assertEqual(self.playerReceives, b"outer inner")
+		self.playerReceives.clear()
+		# Writes outside a batch are sent immediately.
+		self.proxy.game.write(b"north")
+		self.assertEqual(self.gameReceives, b"north")
+		self.gameReceives.clear()
+		# A batch started in another thread does not delay writes from this thread.
+		thread: threading.Thread = threading.Thread(target=self.proxy.beginBatch)
+		thread.start()
+		thread.join()
+		self.proxy.player.write(b"Hello")
+		self.assertEqual(self.playerReceives, b"Hello")
+		self.playerReceives.clear()
+		# A failed write to one side does not lose the data bound for the other side.
+		self.proxy.beginBatch()
+		self.proxy.player.write(b"Hello")
+		self.proxy.game.write(b"look")
+		with patch.object(self.proxy, "_playerWriter", side_effect=ConnectionError):
+			self.assertRaises(ConnectionError, self.proxy.flushBatch)
+		self.assertEqual((self.playerReceives, self.gameReceives), (b"", b"look"))
+
 	def testProxyHandlerOn_playerReceived(self) -> None:
 		data: bytes = b"Hello world!"
 		self.proxy.isEmulatingOffline = False